@@ -1,15 +1,53 @@
 import time
 import logging
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
-
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s"
-)
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+class TokenBucket:
+    def __init__(self, rate: int = 60, per: float = 60.0) -> None:
+        """
+        Método construtor da classe TokenBucket, para limitar a taxa de requisições
+        feitas à API da OpenWeather (60 requisições por minuto).
+
+        Args:
+            rate:
+                Quantidade de requisições permitidas dentro do intervalo. Padrão é 60.
+            per:
+                Intervalo de tempo, em segundos, em que as requisições são permitidas. Padrão é 60.0.
+        """
+        self.rate = rate
+        self.per = per
+
+        self._tokens = float(rate)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """
+        Método para consumir um token do bucket, aguardando somente quando
+        a janela de requisições estiver esgotada.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    float(self.rate),
+                    self._tokens + (now - self._last_refill) * (self.rate / self.per)
+                )
+                self._last_refill = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait_time = (1 - self._tokens) * (self.per / self.rate)
+            time.sleep(wait_time)
+
 class ExtractDataCurrentWeather:
     def __init__(
         self,
@@ -17,7 +55,8 @@ class ExtractDataCurrentWeather:
         api_key: str = None,
         mode: str = 'json',
         units: str = 'metric',
-        lang: str = 'pt_br'
+        lang: str = 'pt_br',
+        requests_per_minute: int = 60
     ) -> None:
         """
         Método construtor da classe ExtractDataCurrentWeather, para extrair os dados da OpenWeather.
@@ -25,7 +64,7 @@ class ExtractDataCurrentWeather:
         Args:
             lat_long_list:
                 Lista contendo a latitude e longitude dos municípios.
-            api_key: 
+            api_key:
                 Chave de API para acessar os dados do OpenWeather.
             mode:
                 Formato que os dados serão recebidos. Padrão é 'json'.
@@ -34,6 +73,8 @@ class ExtractDataCurrentWeather:
                 Unidade de medida para os dados retornados. Padrão é 'metric'.
             lang:
                 Idioma dos dados retornados. Padrão é 'pt_br'.
+            requests_per_minute:
+                Limite de requisições por minuto permitido pela API. Padrão é 60.
         """
         self.lat_long_list = lat_long_list
         self.api_key = api_key
@@ -43,49 +84,84 @@ class ExtractDataCurrentWeather:
 
         self.url = "https://api.openweathermap.org/data/2.5"
         self.endpoint = "weather"
+        self.full_url = f"{self.url}/{self.endpoint}"
+        self.base_params = {
+            'appid': self.api_key,
+            'mode': self.mode,
+            'units': self.units,
+            'lang': self.lang
+        }
+
+        self.max_workers = 16
+        self.rate_limiter = TokenBucket(rate=requests_per_minute, per=60.0)
+        self.timeout = 10
+
+        self.session = requests.Session()
+        self.session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=self.max_workers,
+                max_retries=Retry(
+                    total=3,
+                    backoff_factor=0.5,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                    respect_retry_after_header=True
+                )
+            )
+        )
 
-    def extract_data(self) -> list[dict]:
+    def extract_data(self) -> Iterator[dict]:
         """
-        Método para extrair os dados da OpenWeather.
+        Método para extrair os dados da OpenWeather, realizando as requisições
+        em paralelo e respeitando o limite de requisições da API. Os dados são
+        produzidos sob demanda, sem materializar todas as respostas em memória.
 
-        Returns:
-            all_weathers:
-                Lista de dicionários contendo os dados da requisição.
+        Yields:
+            Dicionário contendo os dados de cada requisição bem-sucedida.
         """
-        all_weathers = []
-        request_interval = 1 # 60 segundos / 60 requisições por minuto = 1 segundo por requisição
-        
         if not self.lat_long_list:
             logger.warning("No latitude and longitude data found for the specified cities.")
-            return None
-        
-        for lat_long in self.lat_long_list:
-            lat, long = lat_long
-            params = {
-                'lat': lat,
-                'lon': long,
-                'appid': self.api_key,
-                'mode': self.mode,
-                'units': self.units,
-                'lang': self.lang
-            }
-            try:
-                response = requests.get(
-                    url=f"{self.url}/{self.endpoint}",
-                    params=params
-                )
-                response.raise_for_status()
-                data = response.json()
-                logging.info(f"Requesting weather data for coordinates: {lat}, {long}")
-                
-                all_weathers.append(data)
-                time.sleep(request_interval)  
-                
-            except requests.exceptions.HTTPError as http_err:
-                logger.error(f"HTTP error occurred: {http_err}")
-            except requests.exceptions.RequestException as req_err:
-                logger.error(f"Request error occurred: {req_err}")
-            except Exception as e:
-                logger.error(f"An error occurred while processing the request: {e}")
-
-        return all_weathers
\ No newline at end of file
+            return
+
+        max_workers = min(self.max_workers, len(self.lat_long_list))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for weather in executor.map(self._fetch, self.lat_long_list):
+                if weather is not None:
+                    yield weather
+
+    def _fetch(self, lat_long: list) -> dict:
+        """
+        Método para requisitar os dados de um único município na OpenWeather.
+
+        Args:
+            lat_long:
+                Lista contendo a latitude e longitude do município.
+
+        Returns:
+            data:
+                Dicionário contendo os dados da requisição, ou None em caso de erro.
+        """
+        lat, long = lat_long
+        params = {'lat': lat, 'lon': long, **self.base_params}
+        try:
+            self.rate_limiter.acquire()
+            response = self.session.get(
+                url=self.full_url,
+                params=params,
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+            data = response.json()
+            logger.info("Requesting weather data for coordinates: %s, %s", lat, long)
+
+            return data
+
+        except requests.exceptions.HTTPError as http_err:
+            logger.error(f"HTTP error occurred: {http_err}")
+        except requests.exceptions.RequestException as req_err:
+            logger.error(f"Request error occurred: {req_err}")
+        except Exception as e:
+            logger.error(f"An error occurred while processing the request: {e}")
+
+        return None
@@ -1,24 +1,101 @@
+import csv
+import io
 import logging
+from collections.abc import Callable, Iterable
 from datetime import datetime
+from functools import lru_cache
+from itertools import batched
 from zoneinfo import ZoneInfo
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 import sqlalchemy as sa
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s"
-)
+try:
+    from fast_json_normalize import fast_json_normalize as _json_normalize
+except ImportError:
+    _json_normalize = pd.json_normalize
+
+try:
+    import adbc_driver_postgresql.dbapi as _adbc_pg
+except ImportError:
+    _adbc_pg = None
 
 logger = logging.getLogger(__name__)
 
+# Template do DDL de evolução de schema, montado uma única vez por mudança de schema.
+_ALTER_TABLE_SQL = 'ALTER TABLE {schema}.{table} {add_columns}'
+
+@lru_cache(maxsize=8)
+def _get_engine(conn_string: str) -> sa.Engine:
+    """
+    Função para criar (e reutilizar) a engine do SQLAlchemy de uma string de
+    conexão, mantendo o pool de conexões vivo entre as cargas. Habilita os
+    "fast execution helpers" do psycopg2 quando o banco de destino for PostgreSQL
+    e o fast_executemany do pyodbc quando for SQL Server.
+
+    Args:
+        conn_string:
+            String de conexão com o banco de dados.
+
+    Returns:
+        engine:
+            Engine do SQLAlchemy configurada para a string de conexão.
+    """
+    if conn_string.startswith('postgresql'):
+        return sa.create_engine(
+            conn_string,
+            executemany_mode='values_plus_batch',
+            insertmanyvalues_page_size=10_000,
+            pool_size=5,
+            max_overflow=10,
+            pool_pre_ping=True
+        )
+    if conn_string.startswith('mssql+pyodbc'):
+        return sa.create_engine(conn_string, fast_executemany=True)
+    return sa.create_engine(conn_string)
+
+def psql_copy(table, conn, keys: list[str], data_iter) -> None:
+    """
+    Função para carregar um lote de dados no PostgreSQL via COPY FROM STDIN,
+    evitando o custo de parse/plan por linha dos INSERTs. Usada como
+    `method=` do pd.DataFrame.to_sql.
+
+    Args:
+        table:
+            Objeto pandas.io.sql.SQLTable de destino.
+        conn:
+            Conexão do SQLAlchemy com o banco de dados.
+        keys:
+            Lista com os nomes das colunas.
+        data_iter:
+            Iterável com as linhas a serem carregadas.
+    """
+    dbapi_conn = conn.connection
+    with dbapi_conn.cursor() as cursor:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerows(data_iter)
+        buffer.seek(0)
+
+        columns = ', '.join(f'"{key}"' for key in keys)
+        table_name = f'{table.schema}.{table.name}' if table.schema else table.name
+        cursor.copy_expert(
+            sql=f'COPY {table_name} ({columns}) FROM STDIN WITH CSV',
+            file=buffer
+        )
+
 class LoadCurrentWeather:
     def __init__(
         self,
-        raw_data: list[dict],
+        raw_data: Iterable[dict],
         conn_string: str,
         schema: str,
-        table_name: str
+        table_name: str,
+        batch_size: int = 10_000,
+        clock: Callable[[], str] = None,
+        use_adbc: bool = True
     ) -> None:
         """
         Método construtor da classe LoadCurrentWeather, para fazer a carga dos dados
@@ -26,58 +103,309 @@ class LoadCurrentWeather:
 
         Args:
             raw_data:
-                Lista de dicionários contendo os dados extraídos da OpenWeather.
+                Iterável (lista ou gerador) de dicionários contendo os dados extraídos da OpenWeather.
             conn_string: 
                 String de conexão com o banco de dados.s
             schema:
                 Esquema do banco de dados onde os dados serão carregados.
             table_name:
                 Nome da tabela onde os dados serão carregados.
+            batch_size:
+                Quantidade de registros carregados por lote. Padrão é 10_000.
+            clock:
+                Função que retorna a data/hora da extração formatada. Se None,
+                utiliza o horário atual de America/Sao_Paulo.
+            use_adbc:
+                Se True, usa a ingestão em bloco via ADBC no PostgreSQL quando o
+                driver adbc-driver-postgresql estiver instalado. Padrão é True.
         """
         self.raw_data = raw_data
         self.conn_string = conn_string
         self.schema = schema
         self.table_name = table_name
+        self.batch_size = batch_size
+        self.use_adbc = use_adbc
         
         self.date_format = '%Y-%m-%d %H:%M:%S'
+        self.clock = clock or (
+            lambda: datetime.now(tz=ZoneInfo("America/Sao_Paulo")).strftime(self.date_format)
+        )
+        self._table = None
+        self._known_columns = None
 
     def load_data(self) -> None:
         """
-        Método para carregar os dados extraídos no banco de dados.
+        Método para carregar os dados extraídos no banco de dados, consumindo o
+        iterável em lotes para não materializar todos os registros em memória.
         """
-        df = self._extract_data()
-        logger.info(f'Extracted data: {len(df)} records.')
-        if df.empty:
+        if self.raw_data is None:
             logger.warning('No data to load.')
             return
-        df = self._add_extract_date(df)
 
-        engine = sa.create_engine(self.conn_string)
+        engine = _get_engine(self.conn_string)
+        total_records = 0
+        self._table = None
+        self._known_columns = None
         try:
             logger.info('Starting data load.')
-            with engine.begin() as connection:
-                df.to_sql(self.table_name, con=connection, if_exists='append', index=False, schema=self.schema)
-            logger.info(f'{len(df)} records successfully loaded.')
+            if engine.dialect.name == 'postgresql' and self.use_adbc and _adbc_pg is not None:
+                total_records = self._load_data_adbc()
+            else:
+                with engine.begin() as connection:
+                    for batch in batched(self.raw_data, self.batch_size):
+                        df = self._extract_data(list(batch))
+                        if df.empty:
+                            continue
+                        df = self._add_extract_date(df)
+                        self._load_batch(df, engine, connection)
+                        total_records += len(df)
+            if total_records == 0:
+                logger.warning('No data to load.')
+                return
+            logger.info(f'{total_records} records successfully loaded.')
         except Exception as exc:
             logger.error('Error loading data: %s', exc, exc_info=True)
-        finally:
-            try:
-                engine.dispose()
-                logger.info('Database engine disposed successfully.')
-            except Exception as dispose_e:
-                logger.warning(f'Failed to dispose connection pool: {dispose_e}')
 
-    def _extract_data(self) -> pd.DataFrame:
+    def _load_batch(self, df: pd.DataFrame, engine: sa.Engine, connection: sa.Connection) -> None:
+        """
+        Método para carregar um lote de dados no banco de dados.
+
+        Args:
+            df:
+                DataFrame contendo o lote de dados a ser carregado.
+            engine:
+                Engine do SQLAlchemy utilizada na conexão.
+            connection:
+                Conexão com o banco de dados.
+        """
+        self._create_new_columns(df, connection)
+
+        if engine.dialect.name != 'postgresql' and self._table is None:
+            if sa.inspect(connection).has_table(self.table_name, schema=self.schema):
+                # Reflete a tabela uma única vez por carga para o caminho insertmanyvalues.
+                self._table = sa.Table(
+                    self.table_name,
+                    sa.MetaData(),
+                    autoload_with=connection,
+                    schema=self.schema
+                )
+
+        if engine.dialect.name != 'postgresql' and self._table is not None:
+            connection.execution_options(insertmanyvalues_page_size=1000).execute(
+                self._table.insert(),
+                df.to_dict(orient='records')
+            )
+            return
+
+        method = psql_copy if engine.dialect.name == 'postgresql' else 'multi'
+        # Limita o total de parâmetros por statement para não estourar o limite do driver.
+        chunksize = max(1, 10_000 // max(1, len(df.columns)))
+        df.to_sql(
+            self.table_name,
+            con=connection,
+            if_exists='append',
+            index=False,
+            schema=self.schema,
+            method=method,
+            chunksize=chunksize
+        )
+
+    def _load_data_adbc(self) -> int:
+        """
+        Método para carregar todos os lotes no PostgreSQL via ADBC, transmitindo
+        os dados em Arrow direto ao servidor, sem a expansão linha a linha do
+        SQLAlchemy. Uma única conexão é usada para o DDL de evolução de schema e
+        para a ingestão, com um único commit ao final, mantendo a carga atômica
+        como nos demais caminhos.
+
+        Returns:
+            total_records:
+                Quantidade de registros carregados.
+        """
+        total_records = 0
+        # O ADBC usa a URI nativa do PostgreSQL, sem o sufixo de driver do SQLAlchemy.
+        uri = f"postgresql://{self.conn_string.split('://', 1)[1]}"
+        with _adbc_pg.connect(uri) as conn:
+            for batch in batched(self.raw_data, self.batch_size):
+                df = self._extract_data(list(batch))
+                if df.empty:
+                    continue
+                df = self._add_extract_date(df)
+                # create_append cria a tabela no primeiro lote, como nos demais caminhos.
+                mode = 'append' if self._adbc_create_new_columns(df, conn) else 'create_append'
+                table = pa.Table.from_pandas(df, preserve_index=False)
+                with conn.cursor() as cursor:
+                    cursor.adbc_ingest(
+                        self.table_name,
+                        table,
+                        mode=mode,
+                        db_schema_name=self.schema
+                    )
+                if self._known_columns is None:
+                    self._known_columns = frozenset(df.columns)
+                total_records += len(df)
+            conn.commit()
+        return total_records
+
+    def _adbc_create_new_columns(self, df: pd.DataFrame, conn) -> bool:
+        """
+        Método para criar, pela própria conexão ADBC, as colunas presentes no
+        DataFrame que ainda não existem na tabela, mantendo o DDL na mesma
+        transação da ingestão.
+
+        Args:
+            df:
+                DataFrame contendo o lote de dados a ser carregado.
+            conn:
+                Conexão ADBC com o banco de dados.
+
+        Returns:
+            True se a tabela já existe no banco de dados, False caso contrário.
+        """
+        df_columns = frozenset(df.columns)
+        if self._known_columns is not None and df_columns <= self._known_columns:
+            return True
+
+        try:
+            table_schema = conn.adbc_get_table_schema(
+                self.table_name,
+                db_schema_filter=self.schema
+            )
+        except _adbc_pg.ProgrammingError:
+            return False
+
+        existing_columns = frozenset(table_schema.names)
+        missing_columns = [column for column in df.columns if column not in existing_columns]
+        if not missing_columns:
+            self._known_columns = existing_columns
+            return True
+
+        add_columns = ', '.join(
+            f'ADD COLUMN "{column}" {self._sql_type(df[column].dtype)}'
+            for column in missing_columns
+        )
+        with conn.cursor() as cursor:
+            cursor.execute(
+                _ALTER_TABLE_SQL.format(
+                    schema=self.schema,
+                    table=self.table_name,
+                    add_columns=add_columns
+                )
+            )
+        self._known_columns = existing_columns | df_columns
+        logger.info(f'Columns {missing_columns} created in {self.schema}.{self.table_name}.')
+        return True
+
+    def _extract_data(self, raw_data: list[dict] = None) -> pd.DataFrame:
         """
-        Método para extrair os dados da lista de dicionários e normalizar em um DataFrame.
+        Método para extrair os dados de uma lista de dicionários e normalizar em um DataFrame.
+
+        Args:
+            raw_data:
+                Lista de dicionários a normalizar. Se None, utiliza self.raw_data.
 
         Returns:
             df:
                 DataFrame contendo os dados normalizados.
         """
-        df = pd.json_normalize(self.raw_data, sep='_').astype(str, errors='ignore')
+        if raw_data is None:
+            raw_data = self.raw_data
+        df = _json_normalize(raw_data, sep='_')
+        for column in df.select_dtypes(include='object').columns:
+            df[column] = df[column].map(
+                lambda value: str(value) if isinstance(value, (list, dict)) else value
+            )
+        # Reduz os dtypes numéricos para diminuir a memória e os bytes enviados ao banco.
+        float_columns = df.select_dtypes(include='float').columns
+        df[float_columns] = df[float_columns].astype('float32')
+        for column in df.select_dtypes(include='integer').columns:
+            df[column] = pd.to_numeric(df[column], downcast='integer')
+        # Colunas de texto de baixa cardinalidade (ex.: descrição do tempo) viram category;
+        # as demais usam storage Arrow, mais compacto que objetos Python por célula.
+        for column in df.select_dtypes(include='object').columns:
+            if df[column].nunique(dropna=True) <= 50:
+                df[column] = df[column].astype('category')
+            else:
+                df[column] = df[column].astype('string[pyarrow]')
         return df
 
+    def _create_new_columns(
+        self,
+        df: pd.DataFrame,
+        connection: sa.Connection,
+        inspector=None
+    ) -> None:
+        """
+        Método para criar na tabela as colunas presentes no DataFrame que ainda
+        não existem no banco de dados, inferindo o tipo a partir do dtype da coluna.
+        O Inspector é recriado a cada verificação, pois ele memoiza a reflexão
+        (has_table, get_columns) e ficaria desatualizado após a criação da tabela
+        ou um ALTER; o frozenset de colunas conhecidas na instância já evita
+        reconsultar o banco quando os lotes seguintes trazem as mesmas colunas.
+
+        Args:
+            df:
+                DataFrame contendo os dados extraídos.
+            connection:
+                Conexão com o banco de dados.
+            inspector:
+                Inspector do SQLAlchemy (ou equivalente) a utilizar. Se None,
+                cria um novo Inspector a partir da conexão.
+        """
+        if inspector is None:
+            inspector = sa.inspect(connection)
+        if not inspector.has_table(self.table_name, schema=self.schema):
+            return
+
+        df_columns = frozenset(df.columns)
+        if self._known_columns is not None and df_columns <= self._known_columns:
+            return
+
+        existing_columns = frozenset(
+            column['name'] for column in inspector.get_columns(self.table_name, schema=self.schema)
+        )
+        missing_columns = [column for column in df.columns if column not in existing_columns]
+        if not missing_columns:
+            self._known_columns = existing_columns
+            return
+
+        add_columns = ', '.join(
+            f'ADD COLUMN "{column}" {self._sql_type(df[column].dtype)}'
+            for column in missing_columns
+        )
+        connection.execute(
+            sa.text(
+                _ALTER_TABLE_SQL.format(
+                    schema=self.schema,
+                    table=self.table_name,
+                    add_columns=add_columns
+                )
+            )
+        )
+        # Invalida a tabela refletida, pois o schema acabou de mudar.
+        self._table = None
+        self._known_columns = existing_columns | df_columns
+        logger.info(f'Columns {missing_columns} created in {self.schema}.{self.table_name}.')
+
+    def _sql_type(self, dtype) -> str:
+        """
+        Método para mapear o dtype de uma coluna do DataFrame para o tipo SQL correspondente.
+
+        Args:
+            dtype:
+                Dtype da coluna do DataFrame.
+
+        Returns:
+            Tipo SQL correspondente ao dtype.
+        """
+        if pd.api.types.is_bool_dtype(dtype):
+            return 'BOOLEAN'
+        if pd.api.types.is_integer_dtype(dtype):
+            return 'BIGINT'
+        if pd.api.types.is_float_dtype(dtype):
+            return 'DOUBLE PRECISION'
+        return 'TEXT'
+
     def _add_extract_date(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Método para adicionar a data de extração dos dados.
@@ -89,5 +417,9 @@ class LoadCurrentWeather:
             df:
                 DataFrame com a coluna 'extract_date' adicionada.
         """
-        df['extract_date'] = datetime.now(tz=ZoneInfo("America/Sao_Paulo")).strftime(self.date_format)
+        # Categórica de um único código: 1 byte por linha em vez de uma string por linha.
+        df['extract_date'] = pd.Categorical.from_codes(
+            np.zeros(len(df), dtype=np.int8),
+            categories=[self.clock()]
+        )
         return df
\ No newline at end of file
@@ -12,6 +12,34 @@ class LatLong:
             file_path: Caminho do arquivo csv.
         """
         self.file_path = file_path
+        self.cache_path = f"{file_path}.parquet"
+
+    def _read_municipios(self) -> pd.DataFrame:
+        """
+        Método para ler o arquivo de municípios, reutilizando um cache Parquet
+        quando existente e mais recente que o CSV, para evitar o parse do CSV a cada execução.
+
+        Returns:
+            df:
+                DataFrame contendo as colunas 'nome', 'latitude' e 'longitude'.
+        """
+        if (
+            os.path.exists(self.cache_path)
+            and os.path.getmtime(self.cache_path) >= os.path.getmtime(self.file_path)
+        ):
+            return pd.read_parquet(self.cache_path)
+
+        df = pd.read_csv(
+            self.file_path,
+            usecols=['nome', 'latitude', 'longitude'],
+            dtype={'nome': 'string', 'latitude': 'float64', 'longitude': 'float64'},
+            engine='pyarrow'
+        )
+        try:
+            df.to_parquet(self.cache_path)
+        except OSError as e:
+            print(f"Could not write cache file {self.cache_path}: {e}")
+        return df
 
     def get_lat_long(self, cities: list[str] = None) -> list:
         """
@@ -31,18 +59,18 @@ class LatLong:
         
         lat_long_list = []
         try:
-            df = pd.read_csv(self.file_path)
+            df = self._read_municipios()
             if 'latitude' not in df.columns or 'longitude' not in df.columns:
                 raise ValueError("The CSV file must contain 'latitude' and 'longitude' columns.")
             if cities is None:
                 lat_long_list.append(df[['latitude', 'longitude']].values.tolist())
             else:
-                for city in cities:
-                    lat_long = df[df['nome'] == city][['latitude', 'longitude']].values.tolist()
-                    if lat_long:
-                        lat_long_list.append(lat_long[0])
-                    else:
-                        print(f"City '{city}' not found in the file.")
+                # Indexa por 'nome' uma única vez para evitar uma varredura completa por cidade.
+                indexed = df.drop_duplicates(subset='nome').set_index('nome')[['latitude', 'longitude']]
+                result = indexed.reindex(cities)
+                for city in result.index[result['latitude'].isna()]:
+                    print(f"City '{city}' not found in the file.")
+                lat_long_list = result.dropna().values.tolist()
         except pd.errors.EmptyDataError:
             print(f"The file {self.file_path} is empty.")
             return lat_long_list
@@ -48,7 +48,7 @@ def mock_response(
         mock_resp.raise_for_status.return_value = None
     return mock_resp
 
-@patch('src.extract.extract_current_weather.requests.get')
+@patch('src.extract.extract_current_weather.requests.Session.get')
 def test_extract_data_response(
     mock_get: MagicMock, instance: ExtractDataCurrentWeather
 ) -> None:
@@ -57,7 +57,7 @@ def test_extract_data_response(
 
     Args:
         mock_get: 
-            Mock do método requests.get.
+            Mock do método requests.Session.get.
         instance: 
             Instância de ExtractDataCurrentWeather para o teste.
     """
@@ -72,7 +72,7 @@ def test_extract_data_response(
     )
 
     # When
-    result = instance.extract_data()
+    result = list(instance.extract_data())
 
     # Then
     assert isinstance(result, list)
@@ -89,10 +89,11 @@ def test_extract_data_response(
             "mode": "json",
             "units": "metric",
             "lang": "pt_br"   
-        }
+        },
+        timeout=10
     )
 
-@patch('src.extract.extract_current_weather.requests.get')
+@patch('src.extract.extract_current_weather.requests.Session.get')
 def test_extract_data_client_error(
     mock_get: MagicMock, instance: ExtractDataCurrentWeather
 ) -> None:
@@ -102,7 +103,7 @@ def test_extract_data_client_error(
 
      Args:
         mock_get: 
-            Mock do método requests.get.
+            Mock do método requests.Session.get.
         instance: 
             Instância de ExtractDataCurrentWeather para o teste.
     """
@@ -113,7 +114,7 @@ def test_extract_data_client_error(
     )
 
     # When
-    result = instance.extract_data()
+    result = list(instance.extract_data())
 
     # Then
     assert result == []
@@ -126,10 +127,11 @@ def test_extract_data_client_error(
             "mode": "json",
             "units": "metric",
             "lang": "pt_br"
-        }
+        },
+        timeout=10
     )
 
-@patch('src.extract.extract_current_weather.requests.get')
+@patch('src.extract.extract_current_weather.requests.Session.get')
 def test_extract_data_server_error(
     mock_get: MagicMock, instance: ExtractDataCurrentWeather
 ) -> None:
@@ -139,7 +141,7 @@ def test_extract_data_server_error(
 
      Args:
         mock_get: 
-            Mock do método requests.get.
+            Mock do método requests.Session.get.
         instance: 
             Instância de ExtractDataCurrentWeather para o teste.
     """
@@ -150,7 +152,7 @@ def test_extract_data_server_error(
     )
 
     # When
-    result = instance.extract_data()
+    result = list(instance.extract_data())
 
     # Then
     assert result == []
@@ -163,10 +165,11 @@ def test_extract_data_server_error(
             "mode": "json",
             "units": "metric",
             "lang": "pt_br"
-        }
+        },
+        timeout=10
     )
 
-@patch('src.extract.extract_current_weather.requests.get')
+@patch('src.extract.extract_current_weather.requests.Session.get')
 def test_extract_data_missing_fields(
     mock_get: MagicMock, instance: ExtractDataCurrentWeather
 ) -> None:
@@ -176,7 +179,7 @@ def test_extract_data_missing_fields(
 
      Args:
         mock_get: 
-            Mock do método requests.get.
+            Mock do método requests.Session.get.
         instance: 
             Instância de ExtractDataCurrentWeather para o teste.
     """
@@ -188,7 +191,7 @@ def test_extract_data_missing_fields(
     )
 
     # When
-    result = instance.extract_data()
+    result = list(instance.extract_data())
 
     # Then
     assert isinstance(result, list)
@@ -205,10 +208,11 @@ def test_extract_data_missing_fields(
             "mode": "json",
             "units": "metric",
             "lang": "pt_br"
-        }
+        },
+        timeout=10
     )
 
-@patch('src.extract.extract_current_weather.requests.get')
+@patch('src.extract.extract_current_weather.requests.Session.get')
 def test_extract_data_connection_error_excepetion(
     mock_get: MagicMock, instance: ExtractDataCurrentWeather
 ) -> None:
@@ -218,7 +222,7 @@ def test_extract_data_connection_error_excepetion(
 
      Args:
         mock_get: 
-            Mock do método requests.get.
+            Mock do método requests.Session.get.
         instance: 
             Instância de ExtractDataCurrentWeather para o teste.
     """
@@ -226,7 +230,7 @@ def test_extract_data_connection_error_excepetion(
     mock_get.side_effect = requests.exceptions.ConnectionError("Connection Error")
 
     # When
-    result = instance.extract_data()
+    result = list(instance.extract_data())
 
     # Then
     assert result == []
@@ -239,5 +243,6 @@ def test_extract_data_connection_error_excepetion(
             "mode": "json",
             "units": "metric",
             "lang": "pt_br"
-        }
+        },
+        timeout=10
     )
\ No newline at end of file